@@ -3,6 +3,7 @@ MQTT Vacuum Camera.
 Version: 2025.2.2
 """
 
+import asyncio
 from functools import partial
 import os
 
@@ -147,7 +148,7 @@ async def async_setup(hass: core.HomeAssistant, config: dict) -> bool:
         """Handle Home Assistant stop event."""
         LOGGER.info("Home Assistant is stopping. Writing down the rooms data.")
         storage = hass.config.path(STORAGE_DIR, CAMERA_STORAGE)
-        if not os.path.exists(storage):
+        if not await asyncio.to_thread(os.path.exists, storage):
             LOGGER.debug("Storage path: %s do not exists. Aborting!", storage)
             return False
         vacuum_entity_id = await async_get_translations_vacuum_id(storage)
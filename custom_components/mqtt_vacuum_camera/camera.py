@@ -117,6 +117,8 @@ class MQTTCamera(CoordinatorEntity, Camera):
         self._init_clear_www_folder()
         self._last_image = None
         self.auth_update_time = None
+        self.auth_stat_time = None  # Monotonic time of the last auth file stat
+        self.auth_stat_mtime = None
         self._rrm_data = False  # Check for rrm data
         # get the colours used in the maps.
         self._colours = ColorsManagement(self._shared)
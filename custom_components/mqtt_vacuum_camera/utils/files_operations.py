@@ -10,19 +10,106 @@ Version: 2025.3.0b0
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import contextlib
 import glob
+import hashlib
 import json
+from operator import itemgetter
 import os
 import re
+import tempfile
+import time
 from typing import Any, Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.storage import STORAGE_DIR
+import orjson
 from valetudo_map_parser.config.types import RoomStore, UserLanguageStore
 
-from ..const import CAMERA_STORAGE, LOGGER
+from ..const import CAMERA_STORAGE, DOMAIN, LOGGER
+
+# Strips the "valetudo_<name>_" prefix and "_camera" suffix from a camera object id.
+_CORE_ID_RE = re.compile(r"^(?:valetudo_[^_]*_)?(.*?)(?:_camera)?$")
+
+# Locates data.language.language in frontend user data that orjson can't parse.
+_USER_LANGUAGE_RE = re.compile(rb'"language"\s*:\s*\{\s*"language"\s*:\s*"([^"]+)"')
+
+# Translation keys for the 16 configurable rooms, built once and reused per language.
+_ROOMS_COUNT = 16
+_COLOR_ROOM_KEYS = tuple(f"color_room_{j}" for j in range(_ROOMS_COUNT))
+_ALPHA_ROOM_KEYS = tuple(f"alpha_room_{j}" for j in range(_ROOMS_COUNT))
+
+# Seconds during which the last stat of the auth file is reused.
+_AUTH_STAT_TTL = 1.0
+
+# System accounts skipped when collecting the users languages.
+_EXCLUDED_USERS = frozenset(
+    {"Supervisor", "Home Assistant Content", "Home Assistant Cloud"}
+)
+
+# hass.data keys of the cached translations and camera storage folder paths.
+_TRANSLATIONS_PATH_KEY = f"{DOMAIN}_translations_path"
+_CAMERA_STORAGE_PATH_KEY = f"{DOMAIN}_camera_storage_path"
+
+# Digest of the JSON last written to each path, with the (size, mtime_ns) of
+# the file right after that write, so unchanged content is not rewritten.
+_JSON_FILE_DIGESTS: dict[str, tuple[bytes, tuple[int, int]]] = {}
+
+# Per vacuum_id: digest of the rooms and languages last applied to the
+# translations, with the {file name: (size, mtime_ns)} of the folder after it.
+_APPLIED_ROOM_DESCRIPTIONS: dict[str, tuple[bytes, dict[str, tuple[int, int]]]] = {}
+
+# Lazily created UserLanguageStore shared by the language helpers.
+_USER_LANGUAGE_STORE: UserLanguageStore | None = None
+
+
+def _get_user_language_store() -> UserLanguageStore:
+    """Return the shared UserLanguageStore instance."""
+    global _USER_LANGUAGE_STORE  # pylint: disable=global-statement
+    if _USER_LANGUAGE_STORE is None:
+        _USER_LANGUAGE_STORE = UserLanguageStore()
+    return _USER_LANGUAGE_STORE
+
+
+def _get_translations_path(hass: HomeAssistant) -> str:
+    """Return the translations folder path, cached on hass.data."""
+    translations_path = hass.data.get(_TRANSLATIONS_PATH_KEY)
+    if translations_path is None:
+        translations_path = hass.config.path(
+            "custom_components/mqtt_vacuum_camera/translations"
+        )
+        hass.data[_TRANSLATIONS_PATH_KEY] = translations_path
+    return translations_path
+
+
+def _get_camera_storage_path(hass: HomeAssistant) -> str:
+    """Return the camera storage folder path, cached on hass.data."""
+    storage_path = hass.data.get(_CAMERA_STORAGE_PATH_KEY)
+    if storage_path is None:
+        storage_path = hass.config.path(STORAGE_DIR, CAMERA_STORAGE)
+        hass.data[_CAMERA_STORAGE_PATH_KEY] = storage_path
+    return storage_path
+
+
+def _get_translations_signature(translations_path: str) -> dict[str, tuple[int, int]]:
+    """Return the (size, mtime_ns) of every JSON file in the translations folder."""
+    signature = {}
+    with os.scandir(translations_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json"):
+                entry_stat = entry.stat()
+                signature[entry.name] = (entry_stat.st_size, entry_stat.st_mtime_ns)
+    return signature
+
+
+def _extract_user_language(user_data: bytes) -> str | None:
+    """Extract data.language.language from the raw frontend user data."""
+    try:
+        return orjson.loads(user_data)["data"]["language"]["language"]
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        match = _USER_LANGUAGE_RE.search(user_data)
+        return match.group(1).decode() if match else None
 
 
 async def async_write_vacuum_id(
@@ -31,16 +118,15 @@ async def async_write_vacuum_id(
     """Write the vacuum_id to a JSON file."""
     # Create the full file path
     if vacuum_id:
-        json_path = f"{hass.config.path(STORAGE_DIR, CAMERA_STORAGE)}/{file_name}"
+        json_path = os.path.join(_get_camera_storage_path(hass), file_name)
         LOGGER.debug("Writing vacuum_id: %s to %s", vacuum_id, json_path)
         # Data to be written
         data = {"vacuum_id": vacuum_id}
         # Write data to a JSON file
-        await async_write_json_to_disk(json_path, data)
-        if os.path.exists(json_path):
+        if await async_write_json_to_disk(json_path, data):
             LOGGER.info("vacuum_id saved: %s", vacuum_id)
         else:
-            LOGGER.warning("Error saving vacuum_id: %s", vacuum_id, exc_info=True)
+            LOGGER.warning("Error saving vacuum_id: %s", vacuum_id)
     else:
         LOGGER.warning("No vacuum_id provided.")
 
@@ -62,19 +148,30 @@ async def async_get_translations_vacuum_id(storage_dir: str) -> str or None:
         return None
 
 
+def list_matching_files(directory: str, prefix: str, suffix: str) -> list[str]:
+    """List the files in directory whose names start with prefix and end with suffix."""
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+            ]
+    except FileNotFoundError:
+        LOGGER.debug("Directory not found: %s", directory)
+        return []
+
+
 def remove_room_data_files(directory: str) -> None:
     """Remove all 'room_data*.json' files in the specified directory."""
-    # Create the full path pattern for glob to match
-    path_pattern = os.path.join(directory, "room_data*.json")
-    # Find all files matching the pattern
-    files = glob.glob(path_pattern)
+    files = list_matching_files(directory, "room_data", ".json")
     if not files:
-        LOGGER.debug("No files found matching pattern: %s", path_pattern)
+        LOGGER.debug("No room_data*.json files found in: %s", directory)
         return
     # Loop through and remove each file
     for file in files:
         try:
-            os.remove(file)
+            os.unlink(file)
             LOGGER.debug("Removed file: %s", file)
         except OSError as e:
             LOGGER.debug("Error removing file %s: %r", file, e, exc_info=True)
@@ -82,9 +179,16 @@ def remove_room_data_files(directory: str) -> None:
 
 def is_auth_updated(self) -> bool | None:
     """Check if the auth file has been updated."""
-    file_path = self.hass.config.path(STORAGE_DIR, "auth")
-    # Get the last modified time of the file
-    last_modified_time = os.path.getmtime(file_path)
+    now = time.monotonic()
+    if self.auth_stat_time is not None and now - self.auth_stat_time < _AUTH_STAT_TTL:
+        # Reuse the last modified time read within the TTL window
+        last_modified_time = self.auth_stat_mtime
+    else:
+        file_path = self.hass.config.path(STORAGE_DIR, "auth")
+        # Get the last modified time of the file
+        last_modified_time = os.stat(file_path).st_mtime
+        self.auth_stat_time = now
+        self.auth_stat_mtime = last_modified_time
     if self.auth_update_time is None:
         self.auth_update_time = last_modified_time
         return True
@@ -98,21 +202,19 @@ def is_auth_updated(self) -> bool | None:
 async def async_find_last_logged_in_user(hass: HomeAssistant) -> str or None:
     """Retrieve the ID of the last logged-in user based on the most recent token usage."""
     users = await hass.auth.async_get_users()  # Fetches list of all user objects
-    last_user = None
-    last_login_time = None
-
-    # Iterate through users to find the one with the most recent activity
-    for user in users:
-        # Iterate through refresh tokens to find the most recent usage
-        for token in user.refresh_tokens.values():
-            if token.last_used_at and (
-                last_login_time is None or token.last_used_at > last_login_time
-            ):
-                last_login_time = token.last_used_at
-                last_user = user
-
-    if last_user:
-        return last_user.id
+    # Find the user with the most recently used refresh token
+    last_login = max(
+        (
+            (token.last_used_at, user)
+            for user in users
+            for token in user.refresh_tokens.values()
+            if token.last_used_at
+        ),
+        key=itemgetter(0),
+        default=None,
+    )
+    if last_login:
+        return last_login[1].id
     LOGGER.info("No users have logged in yet.")
     return None
 
@@ -120,10 +222,9 @@ async def async_find_last_logged_in_user(hass: HomeAssistant) -> str or None:
 async def async_get_user_ids(hass: HomeAssistant) -> list[str]:
     """Get the user IDs, excluding certain system users."""
     users = await hass.auth.async_get_users()
-    excluded_users = ["Supervisor", "Home Assistant Content", "Home Assistant Cloud"]
 
-    # Filter out users based on their name not being in the excluded list
-    user_ids = [user.id for user in users if user.name not in excluded_users]
+    # Filter out users based on their name not being in the excluded set
+    user_ids = [user.id for user in users if user.name not in _EXCLUDED_USERS]
 
     return user_ids
 
@@ -139,7 +240,7 @@ async def async_get_active_user_language(hass: HomeAssistant) -> str:
         LOGGER.info("No active user found. Defaulting to English language.")
         return "en"
 
-    user_language_store = UserLanguageStore()
+    user_language_store = _get_user_language_store()
 
     # Try to get the language from UserLanguageStore
     language = await user_language_store.get_user_language(active_user_id)
@@ -151,16 +252,16 @@ async def async_get_active_user_language(hass: HomeAssistant) -> str:
         STORAGE_DIR, f"frontend.user_data_{active_user_id}"
     )
     try:
-        if os.path.exists(user_data_path):
-            user_data_file = await async_load_file(user_data_path)
-            if user_data_file:
-                data = json.loads(user_data_file)
-                language = data["data"]["language"]["language"]
-                # Optionally, update the UserLanguageStore with this information
-                await user_language_store.set_user_language(active_user_id, language)
-                return language
-            raise KeyError
-    except (KeyError, json.JSONDecodeError, FileNotFoundError) as e:
+        if not await asyncio.to_thread(os.path.exists, user_data_path):
+            raise FileNotFoundError(user_data_path)
+        user_data_file = await async_load_file(user_data_path, is_binary=True)
+        language = _extract_user_language(user_data_file) if user_data_file else None
+        if language:
+            # Optionally, update the UserLanguageStore with this information
+            await user_language_store.set_user_language(active_user_id, language)
+            return language
+        raise KeyError("language")
+    except (KeyError, FileNotFoundError) as e:
         LOGGER.debug("Defaulting to English language due to error: %s", e)
     return "en"
 
@@ -172,7 +273,7 @@ async def async_load_languages(selected_languages=None) -> list:
     if selected_languages is None:
         selected_languages = []
 
-    user_language_store = UserLanguageStore()
+    user_language_store = _get_user_language_store()
     try:
         all_languages = await user_language_store.get_all_languages()
         if all_languages:
@@ -188,7 +289,7 @@ async def async_populate_user_languages(hass: HomeAssistant):
     Populate the UserLanguageStore with languages for all users excluding system accounts.
     """
     try:
-        user_language_store = UserLanguageStore()
+        user_language_store = _get_user_language_store()
 
         # Check if already initialized
         test_instance = await UserLanguageStore.is_initialized()
@@ -198,32 +299,30 @@ async def async_populate_user_languages(hass: HomeAssistant):
 
         user_ids = await async_get_user_ids(hass)  # This function excludes system users
 
-        for user_id in user_ids:
+        async def _async_load_user_data(user_id: str) -> bytes | None:
+            """Load the frontend user data of a user, if any."""
             user_data_file = hass.config.path(
                 STORAGE_DIR, f"frontend.user_data_{user_id}"
             )
+            if not await asyncio.to_thread(os.path.exists, user_data_file):
+                return None
+            return await async_load_file(user_data_file, is_binary=True)
 
-            if os.path.exists(user_data_file):
-                user_data = await async_load_file(user_data_file)
-                try:
-                    data = json.loads(user_data)
-                    language = data["data"]["language"]["language"]
-                    await user_language_store.set_user_language(user_id, language)
-                    LOGGER.info("User ID: %s, language: %s", user_id, language)
-                except KeyError:
-                    LOGGER.error(
-                        "Key error while processing user ID: %s", user_id, exc_info=True
-                    )
-                except json.JSONDecodeError as json_error:
-                    LOGGER.error(
-                        "JSON decode error for user ID: %s: %r",
-                        user_id,
-                        json_error,
-                        exc_info=True,
-                    )
-            else:
+        # Read all the users data files concurrently
+        users_data = await asyncio.gather(
+            *(_async_load_user_data(user_id) for user_id in user_ids)
+        )
+
+        for user_id, user_data in zip(user_ids, users_data):
+            if user_data is None:
                 LOGGER.info("User ID: %s, skipping...", user_id)
                 continue
+            language = _extract_user_language(user_data)
+            if language:
+                await user_language_store.set_user_language(user_id, language)
+                LOGGER.info("User ID: %s, language: %s", user_id, language)
+            else:
+                LOGGER.error("Language not found for user ID: %s", user_id)
 
         # Mark as initialized after populating
         UserLanguageStore._initialized = True
@@ -240,32 +339,27 @@ async def async_load_translations_json(
     """
     Load the user selected language json files and return them as a list of JSON objects.
     """
-    translations_list = []
-    translations_path = hass.config.path(
-        "custom_components/mqtt_vacuum_camera/translations"
+    translations_path = _get_translations_path(hass)
+    LOGGER.debug("Loading translations for languages: %s", languages)
+    # Missing files are reported as None by async_load_file
+    return await asyncio.gather(
+        *(
+            async_load_file(os.path.join(translations_path, f"{language}.json"), True)
+            for language in languages
+        )
     )
 
-    for language in languages:
-        LOGGER.debug("Loading translations for language: %s", language)
-        locals_file_name = f"{language}.json"
-        locals_file_path = f"{translations_path}/{locals_file_name}"
-
-        try:
-            translations = await async_load_file(locals_file_path, True)
-            translations_list.append(translations)
-        except FileNotFoundError:
-            translations_list.append(None)
-
-    return translations_list
 
-
-async def async_rename_room_description(hass: HomeAssistant, vacuum_id: str) -> bool:
+async def async_rename_room_description(
+    hass: HomeAssistant, vacuum_id: str, room_data: dict | None = None
+) -> bool:
     """
     Add room names to the room descriptions in the translations.
+    Callers that already hold the rooms data can pass it as room_data.
     """
-    # Load the room data using the new MQTT-based function
-    rooms = RoomStore(vacuum_id)
-    room_data = rooms.get_rooms()
+    if room_data is None:
+        # Load the room data using the new MQTT-based function
+        room_data = RoomStore(vacuum_id).get_rooms()
 
     if not room_data:
         LOGGER.warning(
@@ -278,8 +372,23 @@ async def async_rename_room_description(hass: HomeAssistant, vacuum_id: str) ->
     await async_write_vacuum_id(hass, "rooms_colours_description.json", vacuum_id)
 
     # Get the languages to modify
-    language = await async_load_languages()
-    edit_path = hass.config.path("custom_components/mqtt_vacuum_camera/translations")
+    # Several users can share a language, each file is edited only once
+    language = list(dict.fromkeys(await async_load_languages()))
+    edit_path = _get_translations_path(hass)
+
+    # Nothing to do if these rooms and languages were already applied and the
+    # translation files were not modified since.
+    rooms_digest = hashlib.blake2b(
+        orjson.dumps([room_data, language], option=orjson.OPT_NON_STR_KEYS),
+        digest_size=16,
+    ).digest()
+    applied = _APPLIED_ROOM_DESCRIPTIONS.get(vacuum_id)
+    if applied is not None and applied[0] == rooms_digest:
+        signature = await asyncio.to_thread(_get_translations_signature, edit_path)
+        if signature == applied[1]:
+            LOGGER.debug("Room descriptions are up to date for %s.", vacuum_id)
+            return True
+
     LOGGER.info("Editing the translations file for language: %s", language)
     data_list = await async_load_translations_json(hass, language)
     if None in data_list:
@@ -289,75 +398,69 @@ async def async_rename_room_description(hass: HomeAssistant, vacuum_id: str) ->
         )
         data_list = await async_load_translations_json(hass, ["en"])
 
-    # Maintain the original room order as stored in the dictionary
-    room_list = list(room_data.items())
+    # Maintain the original room order as stored in the dictionary and build
+    # the room labels once; unused slots are cleared with an empty string.
+    room_descriptions = [""] * _ROOMS_COUNT
+    room_alpha_labels = [""] * _ROOMS_COUNT
+    for j, (room_id, room_info) in enumerate(list(room_data.items())[:_ROOMS_COUNT]):
+        # Get the room name; if missing, fallback to a default name
+        room_name = room_info.get("name", f"Room {room_id}")
+        room_descriptions[j] = f"### **RoomID {room_id} {room_name}**"
+        room_alpha_labels[j] = f"RoomID {room_id} {room_name}"
 
     # Modify the "data_description" keys for rooms_colours_1 and rooms_colours_2
+    # and the "data" keys for alpha_2 and alpha_3 in a single pass
     for data in data_list:
         if data is None:
             continue
 
+        steps = data["options"]["step"]
         for i in range(1, 3):
-            room_key = f"rooms_colours_{i}"
-            # For rooms_colours_1 use rooms 0-7, for rooms_colours_2 use 8-15
+            descriptions = steps[f"rooms_colours_{i}"]["data_description"]
+            alpha_data = steps[f"alpha_{i + 1}"]["data"]
+            # rooms_colours_1 / alpha_2 use rooms 0-7, rooms_colours_2 / alpha_3 8-15
             start_index = 0 if i == 1 else 8
-            end_index = 8 if i == 1 else 16
-
-            for j in range(start_index, end_index):
-                if j < len(room_list):
-                    room_id, room_info = room_list[j]
-                    # Get the room name; if missing, fallback to a default name
-                    room_name = room_info.get("name", f"Room {room_id}")
-                    data["options"]["step"][room_key]["data_description"][
-                        f"color_room_{j}"
-                    ] = f"### **RoomID {room_id} {room_name}**"
-                else:
-                    # Clear unused keys if there are fewer rooms than expected
-                    data["options"]["step"][room_key]["data_description"][
-                        f"color_room_{j}"
-                    ] = ""
-
-    # Modify the "data" keys for alpha_2 and alpha_3
-    for data in data_list:
-        if data is None:
-            continue
-
-        for i in range(2, 4):
-            alpha_key = f"alpha_{i}"
-            start_index = 0 if i == 2 else 8
-            end_index = 8 if i == 2 else 16
-
-            for j in range(start_index, end_index):
-                if j < len(room_list):
-                    room_id, room_info = room_list[j]
-                    room_name = room_info.get("name", f"Room {room_id}")
-                    data["options"]["step"][alpha_key]["data"][f"alpha_room_{j}"] = (
-                        f"RoomID {room_id} {room_name}"
-                    )
-                else:
-                    data["options"]["step"][alpha_key]["data"][f"alpha_room_{j}"] = ""
+            for j in range(start_index, start_index + 8):
+                descriptions[_COLOR_ROOM_KEYS[j]] = room_descriptions[j]
+                alpha_data[_ALPHA_ROOM_KEYS[j]] = room_alpha_labels[j]
 
     # Write the modified data back to the JSON files
+    languages_written = []
+    writes = []
     for idx, data in enumerate(data_list):
         if data is not None:
             lang = language[idx] if isinstance(language, list) else language
-            await async_write_json_to_disk(
-                os.path.join(edit_path, f"{lang}.json"), data
-            )
-            LOGGER.info(
-                "Room names added to the room descriptions in the %s translations.",
-                lang,
+            languages_written.append(lang)
+            writes.append(
+                async_write_json_to_disk(os.path.join(edit_path, f"{lang}.json"), data)
             )
+    if not all(await asyncio.gather(*writes)):
+        # Leave the applied state untouched so the next call retries
+        LOGGER.warning(
+            "Room names could not be added to all the %s translations.",
+            languages_written,
+        )
+        return False
+    LOGGER.info(
+        "Room names added to the room descriptions in the %s translations.",
+        languages_written,
+    )
+    _APPLIED_ROOM_DESCRIPTIONS[vacuum_id] = (
+        rooms_digest,
+        await asyncio.to_thread(_get_translations_signature, edit_path),
+    )
     return True
 
 
 async def async_del_file(file):
     """Delete a file if it exists."""
-    if os.path.exists(file):
-        LOGGER.info("Removing the file %s", file)
-        os.remove(file)
-    else:
+    try:
+        await asyncio.to_thread(os.unlink, file)
+        LOGGER.info("Removed the file %s", file)
+    except FileNotFoundError:
         LOGGER.debug("File not found: %s", file)
+    except OSError as e:
+        LOGGER.warning("Error removing the file %s: %r", file, e)
 
 
 async def async_write_file_to_disk(
@@ -384,31 +487,76 @@ async def async_write_file_to_disk(
         LOGGER.warning("Unexpected issue detected: %s", e, exc_info=True)
 
 
-async def async_write_json_to_disk(file_to_write: str, json_data) -> None:
-    """Asynchronously write data to a JSON file."""
+async def async_write_json_to_disk(file_to_write: str, json_data) -> bool:
+    """Asynchronously write data to a JSON file, return False if it failed."""
 
     def _write_to_file(file_path, data):
         """Helper function to write data to a file."""
-        with open(file_path, "w") as datafile:
-            json.dump(data, datafile, indent=2)
+        json_bytes = orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_APPEND_NEWLINE,
+        )
+        digest = hashlib.blake2b(json_bytes, digest_size=16).digest()
+        # Skip the write if the file still holds exactly what we wrote last time
+        last_written = _JSON_FILE_DIGESTS.get(file_path)
+        if last_written is not None and last_written[0] == digest:
+            try:
+                file_stat = os.stat(file_path)
+                if (file_stat.st_size, file_stat.st_mtime_ns) == last_written[1]:
+                    return
+            except FileNotFoundError:
+                pass
+        # Write to a temporary file and swap it in, so readers never see a
+        # partially written file; no fsync, the kernel flushes it as usual.
+        # Each write gets its own temporary file, so concurrent writers of the
+        # same path never share one.
+        tmp_fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(file_path) or None,
+            prefix=f".{os.path.basename(file_path)}.",
+            suffix=".tmp",
+        )
+        try:
+            with os.fdopen(tmp_fd, "wb") as datafile:
+                datafile.write(json_bytes)
+            # mkstemp creates the file as 0600, keep the usual permissions
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+        file_stat = os.stat(file_path)
+        _JSON_FILE_DIGESTS[file_path] = (
+            digest,
+            (file_stat.st_size, file_stat.st_mtime_ns),
+        )
 
     try:
         await asyncio.to_thread(_write_to_file, file_to_write, json_data)
-    except (OSError, IOError, json.JSONDecodeError) as e:
+        return True
+    except (OSError, IOError, orjson.JSONEncodeError) as e:
         LOGGER.warning("Json File Operation Error: %s", e, exc_info=True)
     except Exception as e:
         LOGGER.warning("Unexpected issue detected: %s", e, exc_info=True)
+    return False
 
 
-async def async_load_file(file_to_load: str, is_json: bool = False) -> Any:
+async def async_load_file(
+    file_to_load: str, is_json: bool = False, is_binary: bool = False
+) -> Any:
     """Asynchronously load JSON data from a file."""
 
-    def read_file(my_file: str, read_json: bool = False):
+    def read_file(my_file: str, read_json: bool = False, read_binary: bool = False):
         """Helper function to read data from a file."""
         try:
             if read_json:
-                with open(my_file) as file:
-                    return json.load(file)
+                with open(my_file, "rb") as file:
+                    return orjson.loads(file.read())
+            elif read_binary:
+                with open(my_file, "rb") as file:
+                    return file.read()
             else:
                 with open(my_file) as file:
                     return file.read()
@@ -417,7 +565,7 @@ async def async_load_file(file_to_load: str, is_json: bool = False) -> Any:
             return None
 
     try:
-        return await asyncio.to_thread(read_file, file_to_load, is_json)
+        return await asyncio.to_thread(read_file, file_to_load, is_json, is_binary)
     except (FileNotFoundError, json.JSONDecodeError) as e:
         LOGGER.warning("Blocking IO issue detected: %s", e, exc_info=True)
         return None
@@ -427,21 +575,19 @@ def extract_core_entity_ids(entity_ids: list[str]) -> list[str]:
     """
     Extracts the core part of the entity IDs.
     """
+    prefix = "camera."
+    prefix_len = len(prefix)
     core_entity_ids = []
     for entity_id in entity_ids:
-        if entity_id.startswith("camera."):
-            core_id = entity_id.split("camera.")[1]
+        if entity_id.startswith(prefix):
             # Strip known prefixes and suffixes
-            core_id = re.sub(r"^(valetudo_[^_]*_)?(.*?)(_camera)?$", r"\2", core_id)
-            core_entity_ids.append(core_id)
+            core_entity_ids.append(_CORE_ID_RE.sub(r"\1", entity_id[prefix_len:]))
     return core_entity_ids
 
 
 async def async_list_files(pattern: str) -> list:
     """List files matching the pattern asynchronously."""
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as pool:
-        return await loop.run_in_executor(pool, glob.glob, pattern)
+    return await asyncio.to_thread(glob.glob, pattern)
 
 
 async def get_trims_files_names(path: str, entity_ids: list[str]) -> list[str]:
@@ -449,7 +595,9 @@ async def get_trims_files_names(path: str, entity_ids: list[str]) -> list[str]:
     Generates the list of file names to delete based on the core entity IDs.
     """
     core_entity_ids = extract_core_entity_ids(entity_ids)
-    file_names = [f"{path}/auto_crop_{core_id}.json" for core_id in core_entity_ids]
+    file_names = [
+        os.path.join(path, f"auto_crop_{core_id}.json") for core_id in core_entity_ids
+    ]
     return file_names
 
 
@@ -458,18 +606,21 @@ async def async_clean_up_all_auto_crop_files(hass: HomeAssistant) -> None:
     Deletes all auto_crop_*.json files in the specified directory.
     """
 
-    directory = hass.config.path(STORAGE_DIR, CAMERA_STORAGE)
-    # Create the pattern to match all auto_crop_*.json files
-    pattern = os.path.join(directory, "auto_crop_*.json")
-    # List all matching files
-    files_to_delete = await async_list_files(pattern)
-    # Iterate over the files and delete each one
-    for file_path in files_to_delete:
-        try:
-            os.remove(file_path)
-            print(f"Deleted: {file_path}")
-        except Exception as e:
-            print(f"Error deleting {file_path}: {e}")
+    directory = _get_camera_storage_path(hass)
+    # List all the auto_crop_*.json files
+    files_to_delete = await asyncio.to_thread(
+        list_matching_files, directory, "auto_crop_", ".json"
+    )
+    # Delete the files concurrently
+    results = await asyncio.gather(
+        *(asyncio.to_thread(os.unlink, file_path) for file_path in files_to_delete),
+        return_exceptions=True,
+    )
+    for file_path, result in zip(files_to_delete, results):
+        if isinstance(result, Exception):
+            LOGGER.warning("Error deleting %s: %r", file_path, result)
+        else:
+            LOGGER.debug("Deleted: %s", file_path)
 
 
 async def async_reset_map_trims(hass: HomeAssistant, entity_list: list) -> bool:
@@ -480,7 +631,7 @@ async def async_reset_map_trims(hass: HomeAssistant, entity_list: list) -> bool:
         LOGGER.debug("No entity IDs provided.")
         raise ServiceValidationError("no_entity_id_provided")
     LOGGER.debug("Resetting the map trims.")
-    files_path = hass.config.path(STORAGE_DIR, CAMERA_STORAGE)
+    files_path = _get_camera_storage_path(hass)
 
     # Collect files to delete
     files_to_delete = await get_trims_files_names(files_path, entity_list)
@@ -490,7 +641,6 @@ async def async_reset_map_trims(hass: HomeAssistant, entity_list: list) -> bool:
         LOGGER.debug("No files found to delete.")
         return False
 
-    for file_path in files_to_delete:
-        await async_del_file(file_path)
+    await asyncio.gather(*(async_del_file(file_path) for file_path in files_to_delete))
 
     return True
@@ -0,0 +1,109 @@
+"""Tests for the translations write-back in files_operations."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.mqtt_vacuum_camera.utils import files_operations
+
+VACUUM_ID = "vacuum.my_vacuum"
+ROOM_DATA = {"16": {"name": "Kitchen"}, "17": {"name": "Bedroom"}}
+
+
+def _translation():
+    """Return the translation steps edited by async_rename_room_description."""
+    return {
+        "options": {
+            "step": {
+                "rooms_colours_1": {"data_description": {}},
+                "rooms_colours_2": {"data_description": {}},
+                "alpha_2": {"data": {}},
+                "alpha_3": {"data": {}},
+            }
+        }
+    }
+
+
+@pytest.fixture
+def translations_dir(tmp_path):
+    """Create the translations folder with an English translation."""
+    path = tmp_path / "custom_components/mqtt_vacuum_camera/translations"
+    path.mkdir(parents=True)
+    (path / "en.json").write_text(json.dumps(_translation()))
+    return path
+
+
+@pytest.fixture
+def mock_hass(tmp_path):
+    """Minimal hass with config.path rooted in tmp_path."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.config.path = lambda *parts: str(tmp_path.joinpath(*parts))
+    return hass
+
+
+@pytest.fixture(autouse=True)
+def reset_caches(monkeypatch):
+    """Start every test without applied or written state."""
+    monkeypatch.setattr(files_operations, "_APPLIED_ROOM_DESCRIPTIONS", {})
+    monkeypatch.setattr(files_operations, "_JSON_FILE_DIGESTS", {})
+    with patch.object(files_operations, "async_write_vacuum_id", AsyncMock()):
+        yield
+
+
+async def test_rename_room_description_retries_failed_write(
+    mock_hass, translations_dir
+):
+    """A failed write-back is not recorded as applied and is retried."""
+    with (
+        patch.object(
+            files_operations, "async_load_languages", AsyncMock(return_value=["en"])
+        ),
+        patch.object(
+            files_operations,
+            "async_write_json_to_disk",
+            AsyncMock(return_value=False),
+        ),
+    ):
+        assert not await files_operations.async_rename_room_description(
+            mock_hass, VACUUM_ID, room_data=ROOM_DATA
+        )
+    assert VACUUM_ID not in files_operations._APPLIED_ROOM_DESCRIPTIONS
+
+    with patch.object(
+        files_operations, "async_load_languages", AsyncMock(return_value=["en"])
+    ):
+        assert await files_operations.async_rename_room_description(
+            mock_hass, VACUUM_ID, room_data=ROOM_DATA
+        )
+    data = json.loads((translations_dir / "en.json").read_text())
+    assert (
+        data["options"]["step"]["rooms_colours_1"]["data_description"]["color_room_0"]
+        == "### **RoomID 16 Kitchen**"
+    )
+    assert VACUUM_ID in files_operations._APPLIED_ROOM_DESCRIPTIONS
+
+
+async def test_rename_room_description_duplicate_languages(mock_hass, translations_dir):
+    """Users sharing a language produce a single write of that translation."""
+    write_json = AsyncMock(wraps=files_operations.async_write_json_to_disk)
+    with (
+        patch.object(
+            files_operations,
+            "async_load_languages",
+            AsyncMock(return_value=["en", "en", "en"]),
+        ),
+        patch.object(files_operations, "async_write_json_to_disk", write_json),
+    ):
+        assert await files_operations.async_rename_room_description(
+            mock_hass, VACUUM_ID, room_data=ROOM_DATA
+        )
+
+    assert write_json.await_count == 1
+    assert sorted(p.name for p in translations_dir.iterdir()) == ["en.json"]
+    data = json.loads((translations_dir / "en.json").read_text())
+    assert (
+        data["options"]["step"]["alpha_2"]["data"]["alpha_room_1"]
+        == "RoomID 17 Bedroom"
+    )